@@ -0,0 +1,84 @@
+"""
+Shared asyncio backend for WebSocket workers.
+A single event loop in one thread drives every exchange connection.
+uvloop is used for that loop when it is installed (it is not available on Windows).
+"""
+
+import asyncio
+import logging
+from collections.abc import Coroutine
+from concurrent.futures import Future
+
+from PyQt6.QtCore import QCoreApplication, QThread
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBackend(QThread):
+    """
+    Thread owning the event loop shared by all WebSocket workers.
+    Coroutines are scheduled onto it with asyncio.run_coroutine_threadsafe.
+    """
+
+    _instance = None
+
+    def __init__(self):
+        super().__init__()
+        # Only this loop uses uvloop; the global policy is left untouched
+        self.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+
+    @classmethod
+    def get_instance(cls) -> "AsyncBackend":
+        if not cls._instance:
+            cls._instance = cls()
+            app = QCoreApplication.instance()
+            if app:
+                app.aboutToQuit.connect(cls._instance.stop)
+        return cls._instance
+
+    @classmethod
+    def stop_instance(cls):
+        """Stop the shared backend if one exists, without creating it."""
+        if cls._instance:
+            cls._instance.stop()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule a coroutine on the shared loop, starting the thread if needed."""
+        if not self.isRunning():
+            self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self):
+        """Run the shared event loop until stop() is called."""
+        logger.info("Async backend loop starting")
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            try:
+                pending = asyncio.all_tasks(self.loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                self.loop.close()
+                logger.info("Async backend loop closed.")
+            except Exception as e:
+                logger.error(f"Async backend cleanup error: {e}")
+
+    def stop(self, timeout_ms: int = 2000):
+        """Stop the shared loop, cancelling any workers still running on it."""
+        if AsyncBackend._instance is self:
+            AsyncBackend._instance = None
+
+        if self.isRunning():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.wait(timeout_ms)
+        elif not self.loop.is_closed() and not self.loop.is_running():
+            # The thread never started, so run() will not close the loop
+            self.loop.close()
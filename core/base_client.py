@@ -16,7 +16,7 @@ class BaseExchangeClient(QObject):
     ticker_updated = pyqtSignal(str, TickerData)
     connection_status = pyqtSignal(bool, str)  # connected, message
     connection_state_changed = pyqtSignal(str, str, int)  # state, message, retry_count
-    stats_updated = pyqtSignal(dict)  # connection statistics
+    stats_updated = pyqtSignal(object)  # ConnStats; do not keep references across emissions
     klines_ready = pyqtSignal(str, list)
     stopped = pyqtSignal()
 
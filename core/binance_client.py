@@ -1,4 +1,3 @@
-import asyncio
 import json
 import logging
 import time
@@ -19,7 +18,7 @@ logger = logging.getLogger(__name__)
 
 class BinanceWebSocketWorker(BaseWebSocketWorker):
     """
-    Worker thread for Binance WebSocket connection.
+    Worker for Binance WebSocket connection.
     Uses aiohttp for proxy support via environment variables.
     """
 
@@ -29,18 +28,7 @@ class BinanceWebSocketWorker(BaseWebSocketWorker):
         super().__init__(pairs, parent)
         self._symbol_map: dict[str, str] = {}
         self._precision_map: dict[str, int] = {}
-        self._session: aiohttp.ClientSession | None = None
         self._ws: aiohttp.ClientWebSocketResponse | None = None
-        self._read_task: asyncio.Task | None = None
-
-    async def _send_ping(self):
-        """Send ping to Binance."""
-        if self._ws and not self._ws.closed:
-            try:
-                # Send a standard WebSocket ping frame
-                await self._ws.ping()
-            except Exception as e:
-                logger.debug(f"Binance ping failed: {e}")
 
     def set_precisions(self, precision_map: dict[str, int]):
         """Update precision map."""
@@ -48,22 +36,42 @@ class BinanceWebSocketWorker(BaseWebSocketWorker):
 
     async def _connect_and_subscribe(self):
         """Connect to Binance WebSocket and subscribe."""
-        # Clean up existing session if any
-        if self._session:
-            await self._session.close()
+        await self._use_socket(await self._open_socket())
 
+    async def _open_socket(self) -> aiohttp.ClientWebSocketResponse:
+        """Open a Binance WebSocket without subscriptions (also used as standby)."""
         proxy_url = get_aiohttp_proxy_url()
 
-        self._session = aiohttp.ClientSession(trust_env=True)
-        self._ws = await self._session.ws_connect(self.WS_URL, proxy=proxy_url)
-        self._connection_start_time = time.time()
+        # aiohttp sends ping frames itself and fails the socket if pongs stop arriving
+        return await self._session.ws_connect(
+            self.WS_URL, proxy=proxy_url, heartbeat=self._ping_interval
+        )
+
+    async def _use_socket(self, socket: aiohttp.ClientWebSocketResponse):
+        """Make the socket active: start reading it and subscribe to current pairs."""
+        # Close the previous socket only; the session (and its connector) is reused
+        await self._close_connection()
 
-        # Spawn read loop
-        self._read_task = self._loop.create_task(self._read_loop())
+        self._ws = socket
+        self._connection_start_time = time.monotonic()
+
+        # Spawn read loop; the base class reconnects when it ends
+        self._reader_task = self._create_task(self._read_loop())
 
         # Subscribe
         await self._update_subscriptions()
 
+    async def _drain_socket(self, socket: aiohttp.ClientWebSocketResponse):
+        """Discard standby frames; receive() is where aiohttp answers server pings."""
+        while not socket.closed:
+            msg = await socket.receive()
+            if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                break
+        await socket.close()
+
+    def _socket_alive(self, socket: aiohttp.ClientWebSocketResponse) -> bool:
+        return not socket.closed
+
     async def fetch_klines_async(self, pair: str, interval: str, limit: int):
         symbol = pair.replace("-", "").upper()
         url = "https://api.binance.com/api/v3/klines"
@@ -99,30 +107,27 @@ class BinanceWebSocketWorker(BaseWebSocketWorker):
             logger.error(f"Failed to fetch klines async for {pair}: {e}")
 
     async def _read_loop(self):
-        """Read loop to handle incoming messages."""
-        try:
-            while self._running and self._ws and not self._ws.closed:
-                try:
-                    # aiohttp handles standard PING frames automatically (autoping=True).
-                    msg = await self._ws.receive(timeout=1.0)
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        self._handle_message(msg.data)
-                    elif msg.type == aiohttp.WSMsgType.PONG:
-                        # Update heartbeat time when we receive a PONG from our manual ping
-                        self._last_message_time = time.time()
-                    elif msg.type == aiohttp.WSMsgType.CLOSED:
-                        break
-                    elif msg.type == aiohttp.WSMsgType.ERROR:
-                        break
-                except asyncio.TimeoutError:
-                    continue
-        except Exception as e:
-            logger.error(f"Binance read loop error: {e}")
-            self._last_error = str(e)
+        """Read loop to handle incoming messages until the socket closes."""
+        ws = self._ws
+        while not ws.closed:
+            # aiohttp answers PINGs (autoping) and closes the socket on heartbeat timeout
+            msg = await ws.receive()
+            if msg.type == aiohttp.WSMsgType.TEXT:
+                self._handle_message(msg.data)
+            elif msg.type == aiohttp.WSMsgType.CLOSED:
+                break
+            elif msg.type == aiohttp.WSMsgType.ERROR:
+                break
+
+        # Surface the socket error (e.g. heartbeat timeout) to the reconnect logic
+        error = ws.exception()
+        if error:
+            logger.error(f"Binance read loop error: {error}")
+            raise error
 
     async def _update_subscriptions(self):
         """Update subscriptions incrementally."""
-        current_pairs = set(self.pairs)
+        current_pairs = set(self._pairs_snapshot)
         new_pairs = current_pairs - self._subscribed_pairs
         removed_pairs = self._subscribed_pairs - current_pairs
 
@@ -131,7 +136,7 @@ class BinanceWebSocketWorker(BaseWebSocketWorker):
 
         # Binance streams need lowercase and removed hyphens
         # refresh symbol map
-        self._symbol_map = {p.replace("-", "").lower(): p for p in self.pairs}
+        self._symbol_map = {p.replace("-", "").lower(): p for p in self._pairs_snapshot}
 
         # Subscribe to new
         if new_pairs:
@@ -174,9 +179,14 @@ class BinanceWebSocketWorker(BaseWebSocketWorker):
         self._subscribed_pairs = current_pairs
         self._update_stats()
 
+    async def _close_connection(self):
+        """Close the WebSocket; the base class closes the shared session."""
+        if self._ws and not self._ws.closed:
+            await self._ws.close()
+
     def _handle_message(self, message):
         try:
-            self._last_message_time = time.time()
+            self._last_message_time = time.monotonic()
             data = json.loads(message)
 
             # Handle Ticker Event (24h Rolling)
@@ -259,21 +269,6 @@ class BinanceWebSocketWorker(BaseWebSocketWorker):
         except Exception as e:
             logger.error(f"Error processing ticker data: {e}")
 
-    def stop(self):
-        """Stop connection and tasks."""
-        self._running = False
-        # The base class handles loop-safe cancellation, but we need to ensure session closes
-        if self._loop and self._loop.is_running():
-
-            async def cleanup():
-                if self._ws:
-                    await self._ws.close()
-                if self._session:
-                    await self._session.close()
-                self._cancel_task_safe()
-
-            self._loop.call_soon_threadsafe(lambda: self._loop.create_task(cleanup()))
-
 
 class BinanceClient(BaseExchangeClient):
     """Binance Client implementation."""
@@ -368,15 +363,15 @@ class BinanceClient(BaseExchangeClient):
 
     def subscribe(self, pairs: list[str]):
         """Subscribe to ticker updates for given pairs with incremental update."""
-        pairs = list(pairs)
+        # Copy without duplicates, so equal lengths plus membership means equal sets
+        pairs = list(dict.fromkeys(pairs))
 
         # If active worker, update incrementally
         if self._worker is not None and self._worker.isRunning():
-            old_pairs = set(self._worker.pairs)
-            new_pairs = set(pairs)
-
-            if old_pairs != new_pairs:
-                self._worker.pairs = pairs
+            # Length check first, then set membership; nothing is built when unchanged
+            old_pairs = self._worker.pair_set
+            if len(pairs) != len(old_pairs) or any(p not in old_pairs for p in pairs):
+                self._worker.set_pairs(pairs)
 
             self._pairs = pairs
             return
@@ -469,5 +464,5 @@ class BinanceClient(BaseExchangeClient):
         if hasattr(self._worker, "_last_message_time"):
             import time
 
-            return (time.time() - self._worker._last_message_time) < 30
+            return (time.monotonic() - self._worker._last_message_time) < 30
         return False
@@ -14,3 +14,20 @@ class TickerData:
     icon_url: str = ""
     display_name: str = ""
     quote_token: str = ""
+
+
+@dataclass(slots=True)
+class ConnStats:
+    """
+    Connection statistics emitted by WebSocket workers.
+    Each worker updates and re-emits a single instance, so consumers must copy
+    what they need in the slot instead of keeping a reference.
+    """
+
+    state: str = "disconnected"
+    reconnect_count: int = 0
+    retry_count: int = 0
+    subscribed_pairs: int = 0
+    connection_duration: float = 0.0
+    last_message_age: float = 0.0
+    last_error: str = ""
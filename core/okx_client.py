@@ -29,8 +29,8 @@ logger = logging.getLogger(__name__)
 
 class OkxWebSocketWorker(BaseWebSocketWorker):
     """
-    Worker thread for OKX WebSocket connection.
-    Runs asyncio event loop in a separate thread.
+    Worker for OKX WebSocket connection.
+    Runs on the shared AsyncBackend event loop.
     Enhanced with automatic reconnection and incremental subscription.
     """
 
@@ -43,23 +43,6 @@ class OkxWebSocketWorker(BaseWebSocketWorker):
         self._heartbeat_interval = 30  # seconds
         self._simple_ws = None  # Reference for simple mode websocket
 
-    async def _send_ping(self):
-        """Send ping to OKX."""
-        try:
-            # 1. Simple Mode
-            if self._simple_ws and not self._simple_ws.closed:
-                # OKX expects literal "ping" string
-                await self._simple_ws.send("ping")
-                return
-
-            # 2. SDK Mode (WsPublicAsync)
-            # The SDK wrapper handles its own connection maintenance.
-            # We cannot easily inject raw messages into the SDK's managed socket.
-            pass
-
-        except Exception as e:
-            logger.debug(f"Failed to send ping: {e}")
-
     async def fetch_klines_async(self, pair: str, interval: str, limit: int):
         okx_interval = interval
         if interval.lower() == "1h":
@@ -75,9 +58,13 @@ class OkxWebSocketWorker(BaseWebSocketWorker):
         try:
             proxy_url = get_aiohttp_proxy_url()
 
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.get(url, params=params, proxy=proxy_url) as response:
+            if self._session and not self._session.closed:
+                async with self._session.get(url, params=params, proxy=proxy_url) as response:
                     data = await response.json()
+            else:
+                async with aiohttp.ClientSession(trust_env=True) as session:
+                    async with session.get(url, params=params, proxy=proxy_url) as response:
+                        data = await response.json()
 
             klines = []
             if data.get("code") == "0":
@@ -107,9 +94,20 @@ class OkxWebSocketWorker(BaseWebSocketWorker):
             return
 
         try:
+            # Stop the client from a previous attempt; the shared loop would keep it alive
+            await self._close_connection()
             self._ws_client = WsPublicAsync(self.WS_PUBLIC_URL)
-            await self._ws_client.start()
-            self._connection_start_time = time.time()
+            # The SDK connects with websockets' default protocol ping interval/timeout
+            consume_task = await self._ws_client.start()
+            self._track_task(consume_task)
+            if self._ws_client.websocket is None:
+                # The SDK still returns a consume task, which fails on the missing socket;
+                # collect it so its exception is not reported as never retrieved
+                consume_task.cancel()
+                await asyncio.gather(consume_task, return_exceptions=True)
+                raise ConnectionError("OKX WebSocket connection failed")
+            self._reader_task = consume_task
+            self._connection_start_time = time.monotonic()
 
             # Subscribe to current pairs
             await self._update_subscriptions()
@@ -118,9 +116,21 @@ class OkxWebSocketWorker(BaseWebSocketWorker):
             self._last_error = str(e)
             raise
 
+    async def _close_connection(self):
+        """Stop the SDK client (which also ends its consume task) or the simple socket."""
+        if self._ws_client:
+            try:
+                await self._ws_client.stop()
+            except Exception as e:
+                logger.debug(f"OKX client stop failed: {e}")
+            self._ws_client = None
+        if self._simple_ws:
+            await self._simple_ws.close()
+            self._simple_ws = None
+
     async def _update_subscriptions(self):
         """Update subscriptions incrementally (only changed pairs)."""
-        current_pairs = set(self.pairs)
+        current_pairs = set(self._pairs_snapshot)
         new_pairs = current_pairs - self._subscribed_pairs
         removed_pairs = self._subscribed_pairs - current_pairs
 
@@ -150,50 +160,35 @@ class OkxWebSocketWorker(BaseWebSocketWorker):
         """Simple WebSocket implementation without python-okx dependency."""
         import websockets
 
-        try:
-            async with websockets.connect(self.WS_PUBLIC_URL) as ws:
-                self._simple_ws = ws
-                self.connection_status.emit(True, "Connected to OKX")
-
-                # We need to expose ws for update_subscriptions?
-                # The original simplified implementation didn't support incremental updates
-                # fully inside simple mode gracefully or it re-sent list.
-                # Original logic:
-                # subscribe_msg = ...
-                # await ws.send(...)
-                # while self._running: ...
-
-                # To support incremental updates here we'd need more complex logic.
-                # For refactoring, I should preserve original behavior.
-                # Original behavior:
-                # Just subscribed once at start.
-
-                subscribe_msg = {
-                    "op": "subscribe",
-                    "args": [{"channel": "tickers", "instId": pair} for pair in self.pairs],
-                }
-                await ws.send(json.dumps(subscribe_msg))
-
-                # Listen for messages
-                while self._running:
-                    try:
-                        message = await asyncio.wait_for(ws.recv(), timeout=1.0)
-                        self._handle_message(message)
-                    except asyncio.TimeoutError:
-                        continue
-                    except websockets.exceptions.ConnectionClosed:
-                        self.connection_status.emit(False, "Connection closed")
-                        break
-        except Exception as e:
-            self.connection_status.emit(False, f"WebSocket error: {e}")
-        finally:
-            self._simple_ws = None
+        await self._close_connection()
+
+        # websockets sends protocol pings and closes the socket if pongs stop arriving
+        self._simple_ws = await websockets.connect(
+            self.WS_PUBLIC_URL,
+            ping_interval=self._ping_interval,
+            ping_timeout=self._connection_timeout,
+        )
+        self._connection_start_time = time.monotonic()
+
+        # Simple mode subscribes once at start (no incremental updates)
+        subscribe_msg = {
+            "op": "subscribe",
+            "args": [{"channel": "tickers", "instId": pair} for pair in self._pairs_snapshot],
+        }
+        await self._simple_ws.send(json.dumps(subscribe_msg))
+
+        self._reader_task = self._create_task(self._simple_read_loop())
+
+    async def _simple_read_loop(self):
+        """Read messages until the socket closes; ConnectionClosedError propagates."""
+        async for message in self._simple_ws:
+            self._handle_message(message)
 
     def _handle_message(self, message):
         """Handle incoming WebSocket message."""
         try:
             # Update last message time for heartbeat detection
-            self._last_message_time = time.time()
+            self._last_message_time = time.monotonic()
 
             if isinstance(message, str):
                 data = json.loads(message)
@@ -269,12 +264,8 @@ class OkxWebSocketWorker(BaseWebSocketWorker):
 
     def update_pairs(self, pairs: list[str]):
         """Update subscription pairs (requires reconnection or incremental)."""
-        self.pairs = pairs
-        # Base class handles reconnection logic if needed via main loop,
-        # but here we rely on _maintain_connection loop checking for differences.
-        # Original: _maintain_connection loop checks:
-        # if set(self.pairs) != self._subscribed_pairs: await self._update_subscriptions()
-        # This logic is now in BaseWebSocketWorker.
+        # BaseWebSocketWorker wakes its connection loop and diffs subscriptions.
+        self.set_pairs(pairs)
 
 
 class OkxClientManager(BaseExchangeClient):
@@ -292,7 +283,7 @@ class OkxClientManager(BaseExchangeClient):
     ticker_updated = pyqtSignal(str, TickerData)  # pair, TickerData object
     connection_status = pyqtSignal(bool, str)  # connected, message
     connection_state_changed = pyqtSignal(str, str, int)  # state, message, retry_count
-    stats_updated = pyqtSignal(dict)  # connection statistics
+    stats_updated = pyqtSignal(object)  # ConnStats; do not keep references across emissions
 
     def __init__(self, parent: QObject | None = None):
         super().__init__(parent)
@@ -309,19 +300,17 @@ class OkxClientManager(BaseExchangeClient):
         Uses incremental updates - only new/removed pairs cause subscription changes.
         Existing connections remain active.
         """
-        pairs = list(pairs)  # Make a copy
+        # Copy without duplicates, so equal lengths plus membership means equal sets
+        pairs = list(dict.fromkeys(pairs))
 
         # If we have an active worker, update incrementally
         if self._worker is not None and self._worker.isRunning():
             # Just update the pairs list and signal the worker
-            old_pairs = set(self._worker.pairs)
-            new_pairs = set(pairs)
-
-            # Check if it's just a change in pairs
-            if old_pairs != new_pairs:
-                # Update worker's pairs list
-                self._worker.pairs = pairs
-                # Worker will detect the change and update subscriptions incrementally
+            # Length check first, then set membership; nothing is built when unchanged
+            old_pairs = self._worker.pair_set
+            if len(pairs) != len(old_pairs) or any(p not in old_pairs for p in pairs):
+                # Update worker's pairs list; the worker wakes and updates incrementally
+                self._worker.set_pairs(pairs)
 
             self._pairs = pairs
             return
@@ -355,7 +344,7 @@ class OkxClientManager(BaseExchangeClient):
             self._pairs.append(pair)
             if self._worker is not None and self._worker.isRunning():
                 # Incremental update - no full reconnect
-                self._worker.pairs = list(self._pairs)
+                self._worker.set_pairs(self._pairs)
             else:
                 # No active worker, create one
                 self._create_worker(self._pairs)
@@ -367,7 +356,7 @@ class OkxClientManager(BaseExchangeClient):
             self._pairs.remove(pair)
             if self._worker is not None and self._worker.isRunning():
                 # Incremental update - no full reconnect
-                self._worker.pairs = list(self._pairs)
+                self._worker.set_pairs(self._pairs)
                 # If no more pairs, stop the worker
                 if not self._pairs:
                     self.stop()
@@ -464,6 +453,6 @@ class OkxClientManager(BaseExchangeClient):
         if hasattr(self._worker, "_last_message_time"):
             import time
 
-            return (time.time() - self._worker._last_message_time) < 30
+            return (time.monotonic() - self._worker._last_message_time) < 30
 
         return False
@@ -1,3 +1,4 @@
+import time
 from dataclasses import dataclass
 
 from PyQt6.QtGui import QColor
@@ -21,6 +22,9 @@ class PriceState:
     display_name: str = ""
     quote_token: str = ""
 
+    # time.monotonic() of the last tick applied to this state
+    updated_at: float = 0.0
+
 
 class PriceTracker:
     MAX_DIFF_RATIO = 0.5
@@ -58,6 +62,7 @@ class PriceTracker:
         state.icon_url = data.icon_url
         state.display_name = data.display_name
         state.quote_token = data.quote_token
+        state.updated_at = time.monotonic()
 
         try:
             high = float(state.high_24h)
@@ -108,3 +108,19 @@ def get_display_name(pair: str, display_name: str | None = None, short: bool = F
         return pair.split("-")[0] if short else pair
 
     return pair
+
+
+def get_dexscreener_url(pair: str) -> str | None:
+    """
+    Get the DexScreener page URL for a DEX pair.
+
+    Args:
+        pair: A "chain:<network>:<address>[:symbol]" pair string.
+
+    Returns:
+        The URL, or None if the pair is not a well-formed DEX pair.
+    """
+    parts = pair.split(":")
+    if len(parts) < 3 or parts[0].lower() != "chain":
+        return None
+    return f"https://dexscreener.com/{parts[1]}/{parts[2]}"
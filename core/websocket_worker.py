@@ -1,17 +1,22 @@
 """
 Base WebSocket worker for crypto exchanges.
-Handles connection management, reconnection logic, and thread lifecycle.
+Handles connection management, reconnection logic, and worker lifecycle.
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import threading
 import time
 from abc import abstractmethod
+from collections.abc import Coroutine
 from enum import Enum
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+import aiohttp
+from PyQt6.QtCore import QObject, pyqtSignal
 
-from core.models import TickerData
+from core.async_backend import AsyncBackend
+from core.models import ConnStats, TickerData
 from core.reconnect_strategy import ReconnectStrategy
 
 logger = logging.getLogger(__name__)
@@ -27,11 +32,18 @@ class ConnectionState(Enum):
     FAILED = "failed"
 
 
-class BaseWebSocketWorker(QThread):
+# States reported as connected on the legacy connection_status signal
+_CONNECTED_STATES = frozenset({ConnectionState.CONNECTED, ConnectionState.CONNECTING})
+# States whose emissions carry the current retry count
+_RETRY_STATES = frozenset({ConnectionState.CONNECTING, ConnectionState.RECONNECTING})
+
+
+class BaseWebSocketWorker(QObject):
     """
-    Base worker thread for WebSocket connections.
-    Runs asyncio event loop in a separate thread.
+    Base worker for WebSocket connections.
+    Runs as a coroutine on the shared AsyncBackend event loop.
     Handles automatic reconnection and signal emission.
+    Keeps a QThread-like start/isRunning/wait/finished interface for WorkerController.
     """
 
     # Signals
@@ -39,63 +51,226 @@ class BaseWebSocketWorker(QThread):
     connection_error = pyqtSignal(str, str)  # pair, error_message
     connection_status = pyqtSignal(bool, str)  # connected, message
     connection_state_changed = pyqtSignal(str, str, int)  # state, message, retry_count
-    stats_updated = pyqtSignal(dict)  # connection statistics
+    stats_updated = pyqtSignal(object)  # ConnStats, reused between emissions
     klines_ready = pyqtSignal(str, list)
+    finished = pyqtSignal()
 
     def __init__(self, pairs: list[str], parent: QObject | None = None):
         super().__init__(parent)
-        self.pairs = list(pairs)  # Store initial pairs
+        # Immutable snapshot + version written by set_pairs(), read by the loop thread
+        self._pairs_lock = threading.Lock()
+        self._pairs_snapshot: tuple[str, ...] = tuple(pairs)
+        self._pairs_set: frozenset[str] = frozenset(self._pairs_snapshot)
+        self._pairs_version = 0
+        self._last_synced_version = -1
         self._running = False
         self._loop: asyncio.AbstractEventLoop | None = None
         self._reconnect_strategy = ReconnectStrategy()
         self._connection_state = ConnectionState.DISCONNECTED
         self._subscribed_pairs: set[str] = set()
+        # Monotonic timestamps (time.monotonic), immune to wall-clock adjustments
         self._last_message_time = 0
         self._connection_start_time = 0
         self._total_reconnect_count = 0
         self._last_error = ""
+        # Single stats object updated in place and re-emitted by _update_stats()
+        self._stats = ConnStats()
+        # Keepalive settings handed to the WebSocket library (it pings and times out itself)
         self._connection_timeout = 5  # seconds
         self._ping_interval = 20  # seconds
         self._main_task = None
+        self._future: concurrent.futures.Future | None = None
+        self._tasks: set[asyncio.Task] = set()
+        # Task reading the current connection; it ending means the connection is gone
+        self._reader_task: asyncio.Task | None = None
+        # Idle, unsubscribed socket promoted when the active connection drops
+        self._standby = None
+        self._standby_task: asyncio.Task | None = None
+        # Reads and discards standby frames so pings are answered and a close is noticed
+        self._standby_drain_task: asyncio.Task | None = None
+        self._standby_retry_delay = 5  # seconds before replacing a standby that died
+        # HTTP session kept for the worker's lifetime so reconnects reuse its connector
+        self._session: aiohttp.ClientSession | None = None
+        self._pairs_changed_event: asyncio.Event | None = None
+        self._last_emitted: tuple[ConnectionState | None, str | None, int] = (None, None, -1)
+
+    def set_pairs(self, pairs: list[str]):
+        """
+        Replace the pairs to track.
+        Safe to call from any thread; wakes the connection loop to resync subscriptions.
+        """
+        snapshot = tuple(pairs)
+        pair_set = frozenset(snapshot)
+        with self._pairs_lock:
+            self._pairs_snapshot = snapshot
+            self._pairs_set = pair_set
+            self._pairs_version += 1
+        if self._loop and self._loop.is_running() and self._pairs_changed_event:
+            self._loop.call_soon_threadsafe(self._pairs_changed_event.set)
+
+    @property
+    def pairs(self) -> tuple[str, ...]:
+        """Current pairs as an immutable snapshot (no copy needed to iterate safely)."""
+        return self._pairs_snapshot
+
+    @property
+    def pair_set(self) -> frozenset[str]:
+        """Current pairs as a frozenset, published together with the snapshot."""
+        return self._pairs_set
 
     def _update_connection_state(self, state: ConnectionState, message: str = ""):
-        """Update connection state and emit signals."""
+        """Update connection state and emit signals (duplicate updates are dropped)."""
         self._connection_state = state
-        retry_count = (
-            self._reconnect_strategy.retry_count if state == ConnectionState.RECONNECTING else 0
-        )
+        retry_count = self._reconnect_strategy.retry_count if state in _RETRY_STATES else 0
+        emitted = (state, message, retry_count)
+        if emitted == self._last_emitted:
+            return
+        self._last_emitted = emitted
+
         self.connection_state_changed.emit(state.value, message, retry_count)
 
         # Emit old-style signal for backward compatibility
-        is_connected = state in [ConnectionState.CONNECTED, ConnectionState.CONNECTING]
+        is_connected = state in _CONNECTED_STATES
         self.connection_status.emit(is_connected, message)
 
     def _update_stats(self):
-        """Update connection statistics."""
-        stats = {
-            "state": self._connection_state.value,
-            "reconnect_count": self._total_reconnect_count,
-            "retry_count": self._reconnect_strategy.retry_count,
-            "subscribed_pairs": len(self._subscribed_pairs),
-            "connection_duration": time.time() - self._connection_start_time
-            if self._connection_start_time > 0
-            else 0,
-            "last_message_age": time.time() - self._last_message_time
-            if self._last_message_time > 0
-            else 0,
-            "last_error": self._last_error,
-        }
+        """Update connection statistics in place and emit the shared ConnStats."""
+        now = time.monotonic()
+        stats = self._stats
+        stats.state = self._connection_state.value
+        stats.reconnect_count = self._total_reconnect_count
+        stats.retry_count = self._reconnect_strategy.retry_count
+        stats.subscribed_pairs = len(self._subscribed_pairs)
+        stats.connection_duration = (
+            now - self._connection_start_time if self._connection_start_time > 0 else 0.0
+        )
+        stats.last_message_age = (
+            now - self._last_message_time if self._last_message_time > 0 else 0.0
+        )
+        stats.last_error = self._last_error
         self.stats_updated.emit(stats)
 
-    def run(self):
-        """Run the WebSocket client in asyncio event loop with auto-reconnect."""
-        logger.info(
-            f"[{self.__class__.__name__}] Starting run loop "
-            f"(Thread: {int(QThread.currentThreadId())})"
-        )
+    def start(self):
+        """Schedule the worker on the shared event loop."""
+        if self.isRunning():
+            return
+        backend = AsyncBackend.get_instance()
+        self._loop = backend.loop
         self._running = True
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
+        self._future = backend.submit(self.run())
+
+    def isRunning(self) -> bool:
+        """Whether the worker coroutine is still scheduled or running."""
+        return self._future is not None and not self._future.done()
+
+    def wait(self, msecs: int | None = None) -> bool:
+        """Block until the worker finishes. Returns False on timeout."""
+        if self._future is None:
+            return True
+        try:
+            self._future.result(timeout=msecs / 1000 if msecs is not None else None)
+        except concurrent.futures.TimeoutError:
+            return False
+        except (concurrent.futures.CancelledError, Exception):
+            pass
+        return True
+
+    def _create_task(self, coro: Coroutine) -> asyncio.Task:
+        """Create a task owned by this worker; it is cancelled when the worker stops."""
+        return self._track_task(self._loop.create_task(coro))
+
+    def _track_task(self, task: asyncio.Task) -> asyncio.Task:
+        """Take ownership of a task created elsewhere (e.g. by an SDK)."""
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _close_connection(self):
+        """
+        Close any open connection resources when the worker stops.
+        Subclasses should override this; the shared loop outlives the worker.
+        """
+        pass
+
+    # Optional standby hooks. Workers that support a warm standby connection override
+    # all four; with the defaults no standby is ever opened and the others are unused.
+
+    async def _open_socket(self):
+        """
+        Open a connected but unsubscribed socket, kept as a warm standby.
+        Returns None when the worker does not support a standby connection.
+        """
+        return None
+
+    async def _use_socket(self, socket):
+        """Make an open socket the active connection and subscribe to current pairs."""
+        pass
+
+    async def _drain_socket(self, socket):
+        """Read and discard frames from the idle standby until it closes."""
+        pass
+
+    def _socket_alive(self, socket) -> bool:
+        """Whether an idle standby socket is still open."""
+        return False
+
+    async def _refresh_standby(self, delay: float = 0):
+        """Open a new standby socket if there is none or it has died."""
+        if delay:
+            await asyncio.sleep(delay)
+        if self._standby is not None and self._socket_alive(self._standby):
+            return
+        try:
+            socket = await self._open_socket()
+        except Exception as e:
+            logger.debug(f"[{self.__class__.__name__}] Standby connection failed: {e}")
+            return
+        if socket is None:
+            return
+
+        self._standby = socket
+        task = self._create_task(self._drain_socket(socket))
+        task.add_done_callback(lambda t: self._on_standby_drained(t, socket))
+        self._standby_drain_task = task
+
+    def _schedule_standby_refresh(self, delay: float = 0):
+        if self._standby_task is None or self._standby_task.done():
+            self._standby_task = self._create_task(self._refresh_standby(delay))
+
+    def _on_standby_drained(self, task: asyncio.Task, socket):
+        """Replace the standby when its drain task ends because the socket closed."""
+        if task.cancelled():
+            # Promotion or shutdown; neither needs a replacement from here
+            return
+        if task.exception() is not None:
+            logger.debug(f"[{self.__class__.__name__}] Standby read failed: {task.exception()}")
+        if self._standby is socket:
+            self._standby = None
+            if self._running:
+                self._schedule_standby_refresh(self._standby_retry_delay)
+
+    async def _stop_standby_drain(self):
+        """Stop reading the standby so the promoted socket has a single reader."""
+        task, self._standby_drain_task = self._standby_drain_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def _take_standby(self):
+        """Detach and return the standby socket if it is still alive."""
+        standby, self._standby = self._standby, None
+        if standby is not None and self._socket_alive(standby):
+            return standby
+        return None
+
+    def _has_live_standby(self) -> bool:
+        return self._standby is not None and self._socket_alive(self._standby)
+
+    async def run(self):
+        """Run the WebSocket client on the shared event loop with auto-reconnect."""
+        logger.info(f"[{self.__class__.__name__}] Starting run loop")
+        self._pairs_changed_event = asyncio.Event()
+        self._session = aiohttp.ClientSession(trust_env=True)
 
         self._update_connection_state(ConnectionState.CONNECTING, "Initializing connection...")
         self._reconnect_strategy.reset()
@@ -103,7 +278,7 @@ class BaseWebSocketWorker(QThread):
         try:
             # Store task reference for cancellation
             self._main_task = self._loop.create_task(self._maintain_connection())
-            self._loop.run_until_complete(self._main_task)
+            await self._main_task
         except asyncio.CancelledError:
             logger.info(f"[{self.__class__.__name__}] Main task cancelled")
             self._update_connection_state(ConnectionState.DISCONNECTED, "Connection cancelled")
@@ -112,20 +287,30 @@ class BaseWebSocketWorker(QThread):
             self._last_error = str(e)
             self._update_connection_state(ConnectionState.FAILED, f"Fatal error: {e}")
         finally:
-            logger.info(f"[{self.__class__.__name__}] Cleaning up loop...")
-            # Clean up all tasks
+            logger.info(f"[{self.__class__.__name__}] Cleaning up tasks...")
+            # Clean up this worker's tasks only; the loop is shared
             try:
-                pending = asyncio.all_tasks(self._loop)
+                await self._close_connection()
+                pending = list(self._tasks)
                 for task in pending:
                     task.cancel()
                 if pending:
-                    self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                self._loop.close()
-                logger.info(f"[{self.__class__.__name__}] Loop closed.")
+                    await asyncio.gather(*pending, return_exceptions=True)
+                await self._session.close()
+                logger.info(f"[{self.__class__.__name__}] Tasks cleaned up.")
             except Exception as e:
-                logger.error(f"Loop cleanup error: {e}")
+                logger.error(f"Task cleanup error: {e}")
+
+            standby, self._standby = self._standby, None
+            if standby is not None:
+                try:
+                    await standby.close()
+                except Exception as e:
+                    logger.debug(f"[{self.__class__.__name__}] Standby close failed: {e}")
 
+            self._running = False
             self._update_connection_state(ConnectionState.DISCONNECTED, "Connection closed")
+            self.finished.emit()
 
     async def _maintain_connection(self):
         """
@@ -134,47 +319,60 @@ class BaseWebSocketWorker(QThread):
         """
         while self._running:
             try:
-                # Attempt to connect
-                self._update_connection_state(
-                    ConnectionState.CONNECTING
-                    if self._reconnect_strategy.retry_count > 0
-                    else ConnectionState.CONNECTING,
-                    f"Connecting... (attempt {self._reconnect_strategy.retry_count + 1})",
-                )
-
-                await self._connect_and_subscribe()
+                # A fresh connection has no server-side subscriptions yet
+                self._subscribed_pairs = set()
+                self._reader_task = None
+                synced_version = self._pairs_version
+
+                standby = self._take_standby()
+                if standby is not None:
+                    # Warm socket: only the subscriptions need to be sent
+                    logger.info(f"[{self.__class__.__name__}] Promoting standby connection")
+                    await self._stop_standby_drain()
+                    await self._use_socket(standby)
+                else:
+                    # Attempt to connect (retry_count travels with the signal for display)
+                    logger.debug(
+                        "[%s] Connecting (attempt %d)",
+                        self.__class__.__name__,
+                        self._reconnect_strategy.retry_count + 1,
+                    )
+                    self._update_connection_state(ConnectionState.CONNECTING)
+                    await self._connect_and_subscribe()
+                self._last_synced_version = synced_version
+                # Count the new connection as activity (is_connected, stats)
+                self._last_message_time = time.monotonic()
                 # If we reach here, connection was successful
                 self._reconnect_strategy.reset()
                 self._update_connection_state(ConnectionState.CONNECTED, "Connected")
                 self._update_stats()
+                self._schedule_standby_refresh()
 
-                # Keep connection alive with periodic checks
-                last_ping_time = time.time()
-
+                # Sleep until pairs change or the connection ends. Keepalive pings and
+                # ping timeouts are handled by the WebSocket library, which closes the
+                # socket (ending the reader task) when the peer stops answering.
                 while self._running:
-                    await asyncio.sleep(1)
-
-                    # 1. Update subscriptions (Thread-safe copy)
-                    # Create a copy to avoid modification during iteration
-                    current_pairs = list(self.pairs)
-                    if set(current_pairs) != self._subscribed_pairs:
+                    pairs_changed = self._loop.create_task(self._pairs_changed_event.wait())
+                    waiters = {pairs_changed}
+                    if self._reader_task:
+                        waiters.add(self._reader_task)
+                    try:
+                        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                    finally:
+                        pairs_changed.cancel()
+
+                    reader = self._reader_task
+                    if reader and reader.done():
+                        if not reader.cancelled() and reader.exception():
+                            raise reader.exception()
+                        raise ConnectionError("Connection closed")
+
+                    # Update subscriptions (only when set_pairs bumped the version)
+                    self._pairs_changed_event.clear()
+                    if self._last_synced_version != self._pairs_version:
+                        synced_version = self._pairs_version
                         await self._update_subscriptions()
-
-                    # 2. Send active ping
-                    if time.time() - last_ping_time > self._ping_interval:
-                        await self._send_ping()
-                        last_ping_time = time.time()
-
-                    # 3. Check heartbeat (Zombie detection)
-                    if self._last_message_time > 0:
-                        time_since_last = time.time() - self._last_message_time
-                        if time_since_last > self._connection_timeout:
-                            self._last_error = f"Heartbeat timeout: {time_since_last:.1f}s"
-                            self._update_connection_state(
-                                ConnectionState.RECONNECTING,
-                                f"Heartbeat timeout after {time_since_last:.1f}s, reconnecting...",
-                            )
-                            break
+                        self._last_synced_version = synced_version
 
             except asyncio.CancelledError:
                 raise  # Propagate cancellation to run()
@@ -182,6 +380,12 @@ class BaseWebSocketWorker(QThread):
                 self._last_error = str(e)
                 error_msg = f"Connection failed: {e}"
 
+                # With a live standby, switch over immediately instead of backing off
+                if self._running and self._has_live_standby():
+                    logger.warning(f"[{self.__class__.__name__}] {error_msg}")
+                    self._total_reconnect_count += 1
+                    continue
+
                 # Check if we should retry
                 if self._reconnect_strategy.should_retry():
                     self._update_connection_state(ConnectionState.RECONNECTING, error_msg)
@@ -195,17 +399,11 @@ class BaseWebSocketWorker(QThread):
                     )
                     raise
 
-    async def _send_ping(self):
-        """
-        Send a ping message to keep the connection alive.
-        Subclasses can override this to implement protocol-specific pings.
-        """
-        pass
-
     @abstractmethod
     async def _connect_and_subscribe(self):
         """
         Connect to WebSocket and subscribe to ticker channels.
+        Should set self._reader_task to the task consuming the connection.
         Must be implemented by subclasses.
         """
         pass
@@ -1,13 +1,15 @@
 import logging
 
-from PyQt6.QtCore import QObject, QThread
+from PyQt6.QtCore import QObject
+
+from core.async_backend import AsyncBackend
 
 logger = logging.getLogger(__name__)
 
 
 class WorkerController(QObject):
     """
-    Centralized controller for managing worker thread lifecycles.
+    Centralized controller for managing worker lifecycles.
     Prevents premature garbage collection and ensures proper cleanup.
     """
 
@@ -15,8 +17,8 @@ class WorkerController(QObject):
 
     def __init__(self):
         super().__init__()
-        self._active_workers: list[QThread] = []
-        self._dying_workers: list[QThread] = []
+        self._active_workers: list[QObject] = []
+        self._dying_workers: list[QObject] = []
 
     @classmethod
     def get_instance(cls) -> "WorkerController":
@@ -24,7 +26,7 @@ class WorkerController(QObject):
             cls._instance = cls()
         return cls._instance
 
-    def register_worker(self, worker: QThread):
+    def register_worker(self, worker: QObject):
         """Register a new active worker."""
         if worker not in self._active_workers:
             self._active_workers.append(worker)
@@ -34,7 +36,7 @@ class WorkerController(QObject):
             worker.finished.connect(lambda: self._on_worker_finished(worker))
             logger.debug(f"Worker registered: {worker}")
 
-    def stop_worker(self, worker: QThread | None):
+    def stop_worker(self, worker: QObject | None):
         """
         Safely stop and cleanup a worker.
         Moves it to dying list to survive until finished.
@@ -64,7 +66,7 @@ class WorkerController(QObject):
             logger.debug(f"Worker already stopped, deleting: {worker}")
             worker.deleteLater()
 
-    def _on_worker_finished(self, worker: QThread):
+    def _on_worker_finished(self, worker: QObject):
         """Handle worker finish event."""
         logger.debug(f"Worker finished: {worker}")
 
@@ -91,3 +93,6 @@ class WorkerController(QObject):
 
         self._active_workers.clear()
         self._dying_workers.clear()
+
+        # Workers run on the shared event loop; stop it once they are gone
+        AsyncBackend.stop_instance()
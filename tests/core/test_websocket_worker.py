@@ -0,0 +1,171 @@
+import asyncio
+import time
+
+from PyQt6.QtCore import Qt
+
+from core.async_backend import AsyncBackend
+from core.websocket_worker import BaseWebSocketWorker, ConnectionState
+
+
+class DummyWorker(BaseWebSocketWorker):
+    async def _connect_and_subscribe(self):
+        pass
+
+    async def _update_subscriptions(self):
+        pass
+
+
+def test_initial_pairs_snapshot():
+    worker = DummyWorker(["BTC-USDT", "ETH-USDT"])
+
+    assert worker._pairs_snapshot == ("BTC-USDT", "ETH-USDT")
+    assert worker._pairs_version == 0
+    assert worker._last_synced_version != worker._pairs_version
+
+
+def test_set_pairs_bumps_version_and_snapshot():
+    worker = DummyWorker(["BTC-USDT"])
+
+    worker.set_pairs(["BTC-USDT", "SOL-USDT"])
+
+    assert worker._pairs_snapshot == ("BTC-USDT", "SOL-USDT")
+    assert worker.pairs is worker._pairs_snapshot
+    assert worker.pair_set == frozenset({"BTC-USDT", "SOL-USDT"})
+    assert worker._pairs_version == 1
+
+
+def test_set_pairs_copies_input():
+    pairs = ["BTC-USDT"]
+    worker = DummyWorker(pairs)
+
+    worker.set_pairs(pairs)
+    pairs.append("ETH-USDT")
+
+    assert worker._pairs_snapshot == ("BTC-USDT",)
+
+
+def test_duplicate_connection_state_is_not_emitted():
+    worker = DummyWorker(["BTC-USDT"])
+    received = []
+    worker.connection_state_changed.connect(lambda *args: received.append(args))
+
+    worker._update_connection_state(ConnectionState.CONNECTING, "Connecting...")
+    worker._update_connection_state(ConnectionState.CONNECTING, "Connecting...")
+    worker._update_connection_state(ConnectionState.CONNECTED, "Connected")
+
+    assert received == [("connecting", "Connecting...", 0), ("connected", "Connected", 0)]
+
+
+class StandbyWorker(DummyWorker):
+    def _socket_alive(self, socket):
+        return socket["open"]
+
+
+def test_take_standby_returns_live_socket_once():
+    worker = StandbyWorker(["BTC-USDT"])
+    socket = {"open": True}
+    worker._standby = socket
+
+    assert worker._take_standby() is socket
+    assert worker._take_standby() is None
+
+
+def test_take_standby_drops_dead_socket():
+    worker = StandbyWorker(["BTC-USDT"])
+    worker._standby = {"open": False}
+
+    assert not worker._has_live_standby()
+    assert worker._take_standby() is None
+    assert worker._standby is None
+
+
+def test_update_stats_reuses_one_object():
+    worker = DummyWorker(["BTC-USDT"])
+    received = []
+    worker.stats_updated.connect(received.append)
+
+    worker._subscribed_pairs = {"BTC-USDT"}
+    worker._update_stats()
+    worker._last_error = "timeout"
+    worker._update_stats()
+
+    assert received[0] is received[1] is worker._stats
+    assert worker._stats.subscribed_pairs == 1
+    assert worker._stats.last_error == "timeout"
+
+
+class FlakyWorker(DummyWorker):
+    """Worker whose first connection drops shortly after subscribing."""
+
+    def __init__(self, pairs):
+        super().__init__(pairs)
+        self._reconnect_strategy.initial_delay = 0.01
+        self.states = []
+        self.connects = 0
+        self.subscriptions = []
+
+    def _update_connection_state(self, state, message=""):
+        self.states.append(state)
+        super()._update_connection_state(state, message)
+
+    async def _connect_and_subscribe(self):
+        self.connects += 1
+        self._reader_task = self._create_task(self._read(self.connects))
+        await self._update_subscriptions()
+
+    async def _read(self, attempt):
+        if attempt == 1:
+            await asyncio.sleep(0.05)
+            raise ConnectionError("dropped")
+        await asyncio.Event().wait()
+
+    async def _update_subscriptions(self):
+        self._subscribed_pairs = set(self.pairs)
+        self.subscriptions.append(self.pairs)
+
+
+def _wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_worker_reconnects_and_resubscribes_on_shared_loop():
+    worker = FlakyWorker(["BTC-USDT"])
+    finished = []
+    # Emitted on the backend thread; no Qt event loop runs here to deliver it queued
+    worker.finished.connect(lambda: finished.append(True), Qt.ConnectionType.DirectConnection)
+    try:
+        worker.start()
+        assert worker.isRunning()
+
+        # Reader failure reconnects with a full resubscribe
+        _wait_until(lambda: worker.connects == 2 and len(worker.subscriptions) == 2)
+        assert worker.subscriptions == [("BTC-USDT",), ("BTC-USDT",)]
+        assert worker._total_reconnect_count == 1
+
+        # set_pairs wakes the loop without waiting for another event
+        worker.set_pairs(["BTC-USDT", "ETH-USDT"])
+        _wait_until(lambda: len(worker.subscriptions) == 3)
+        assert worker.subscriptions[-1] == ("BTC-USDT", "ETH-USDT")
+
+        worker.stop()
+        assert worker.wait(2000)
+    finally:
+        AsyncBackend.stop_instance()
+
+    assert not worker.isRunning()
+    assert finished == [True]
+    assert worker._tasks == set()
+    assert worker._session.closed
+    assert worker.states == [
+        ConnectionState.CONNECTING,
+        ConnectionState.CONNECTING,
+        ConnectionState.CONNECTED,
+        ConnectionState.RECONNECTING,
+        ConnectionState.CONNECTING,
+        ConnectionState.CONNECTED,
+        ConnectionState.DISCONNECTED,
+        ConnectionState.DISCONNECTED,
+    ]
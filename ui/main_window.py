@@ -3,7 +3,10 @@ Main application window using Fluent Design.
 """
 
 import logging
+import time
 import webbrowser
+from collections import OrderedDict
+from collections.abc import Callable
 
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QIcon, QMouseEvent
@@ -19,6 +22,7 @@ from qfluentwidgets import Theme, setTheme
 from config.settings import get_settings_manager
 from core.i18n import _
 from core.market_data_controller import MarketDataController
+from core.utils import get_dexscreener_url
 
 # New components
 from ui.behaviors.window_behavior import DraggableWindowBehavior
@@ -34,6 +38,19 @@ from ui.widgets.toolbar import Toolbar
 
 logger = logging.getLogger(__name__)
 
+# Central widget stylesheets per theme, built once instead of on every window setup
+_DARK_CSS = "QWidget { background-color: #1B2636; border-radius: 8px; }"
+_LIGHT_CSS = "QWidget { background-color: #FAFAFA; border-radius: 8px; }"
+
+# Replayed prices older than this are dimmed as stale after a reconnect
+_STALE_AFTER_SECONDS = 10
+
+# Handlers for specific (previous, new) connection state transitions
+_TRANSITIONS: dict[tuple[str | None, str], Callable[["MainWindow"], None]] = {
+    # A retry is starting: rebuild the client so it picks up the current proxy settings
+    ("reconnecting", "connecting"): lambda window: window._market_controller.set_proxy(),
+}
+
 
 class MainWindow(QMainWindow):
     """Main application window with Fluent Design components."""
@@ -42,14 +59,32 @@ class MainWindow(QMainWindow):
         super().__init__()
 
         self._settings_window: SettingsWindow | None = None
-        self._cards: dict[str, CryptoCard] = {}
+        # LRU cache of card widgets, bounded so off-page cards don't accumulate
+        self._cards: OrderedDict[str, CryptoCard] = OrderedDict()
         self._edit_mode = False
 
+        # Last rendered page, used to apply only the delta on the next render
+        self._visible_now: list[str] = []
+        self._last_edit_mode = False
+
         self._last_connection_state = None
+        # Applied to cards as they are placed; only visible cards are updated on change.
+        # None until the first state arrives, so new cards keep their loading text.
+        self._current_conn_state: str | None = None
+
+        # Ticker updates are coalesced and flushed at most once per frame
+        self._pending_ticks: dict[str, object] = {}
+        self._flush_scheduled = False
+        # Pairs that received ticks while off-page; refreshed when shown again
+        self._stale_pairs: set[str] = set()
+        # Window height adjustments are coalesced into one per event loop pass
+        self._resize_pending = False
 
         # Core components
         self._settings_manager = get_settings_manager()
         self._market_controller = MarketDataController(self)
+        self._cache_cap = self._card_cache_cap(self._settings_manager.settings.display_limit)
+        self._url_template = self._build_url_template()
 
         # Initialize Managers and Behaviors
         self._window_behavior = DraggableWindowBehavior(self)
@@ -75,7 +110,7 @@ class MainWindow(QMainWindow):
         self._market_controller.start()
 
         # Initial size adjustment
-        QTimer.singleShot(100, self._view_manager.adjust_window_height)
+        QTimer.singleShot(100, self._schedule_adjust_window_height)
 
     def _setup_ui(self):
         """Setup the main window UI with Fluent Design components."""
@@ -96,13 +131,7 @@ class MainWindow(QMainWindow):
 
         central = QWidget()
         theme_mode = self._settings_manager.settings.theme_mode
-        bg_color = "#1B2636" if theme_mode == "dark" else "#FAFAFA"
-        central.setStyleSheet(f"""
-            QWidget {{
-                background-color: {bg_color};
-                border-radius: 8px;
-            }}
-        """)
+        central.setStyleSheet(_DARK_CSS if theme_mode == "dark" else _LIGHT_CSS)
         self.setCentralWidget(central)
 
         layout = QVBoxLayout(central)
@@ -157,14 +186,19 @@ class MainWindow(QMainWindow):
         pairs = self._settings_manager.settings.crypto_pairs
         visible_pairs = self._pagination_manager.get_visible_slice(pairs)
 
-        # Clear existing cards from layout (but keep them cached)
-        while self.cards_layout.count() > 1:
-            item = self.cards_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
+        # Detach cards that left the page (but keep them cached)
+        visible_set = set(visible_pairs)
+        for pair in self._visible_now:
+            if pair not in visible_set and pair in self._cards:
+                card = self._cards[pair]
+                self.cards_layout.removeWidget(card)
+                card.setParent(None)
 
-        # Add cards for visible pairs
-        for pair in visible_pairs:
+        edit_mode_changed = self._edit_mode != self._last_edit_mode
+        self._last_edit_mode = self._edit_mode
+
+        # Place visible cards, only moving those not already at their index
+        for index, pair in enumerate(visible_pairs):
             if pair not in self._cards:
                 card = CryptoCard(pair)
                 card.double_clicked.connect(self._open_pair_in_browser)
@@ -174,12 +208,50 @@ class MainWindow(QMainWindow):
                 card.view_alerts_requested.connect(self._on_view_alerts_requested)
                 self._cards[pair] = card
 
+            self._cards.move_to_end(pair)
             card = self._cards[pair]
-            card.set_edit_mode(self._edit_mode)
-            self.cards_layout.insertWidget(self.cards_layout.count() - 1, card)
-
+            current_index = self.cards_layout.indexOf(card)
+            if current_index != index:
+                if current_index >= 0:
+                    self.cards_layout.removeWidget(card)
+                self.cards_layout.insertWidget(index, card)
+            if current_index < 0 or edit_mode_changed:
+                card.set_edit_mode(self._edit_mode)
+
+            if pair in self._stale_pairs:
+                self._stale_pairs.discard(pair)
+                state = self._market_controller.get_price_state(pair)
+                if state:
+                    card.update_state(state)
+            if current_index < 0 and self._current_conn_state is not None:
+                card.set_connection_state(self._current_conn_state)
+
+        self._visible_now = visible_pairs
+        self._evict_cards()
+        self._schedule_adjust_window_height()
+
+    def _schedule_adjust_window_height(self):
+        """Resize the window once after the current burst of UI updates."""
+        if not self._resize_pending:
+            self._resize_pending = True
+            QTimer.singleShot(0, self._do_adjust_window_height)
+
+    def _do_adjust_window_height(self):
+        self._resize_pending = False
         self._view_manager.adjust_window_height()
 
+    @staticmethod
+    def _card_cache_cap(display_limit: int) -> int:
+        return max(32, 3 * display_limit)
+
+    def _evict_cards(self):
+        """Delete least recently shown cards beyond the cache cap."""
+        while len(self._cards) > self._cache_cap:
+            pair, card = self._cards.popitem(last=False)
+            card.deleteLater()
+            # Restore the latest price if the card is recreated later
+            self._stale_pairs.add(pair)
+
     def _open_settings(self):
         """Open settings window."""
         if self._settings_window is None or not self._settings_window.isVisible():
@@ -202,20 +274,57 @@ class MainWindow(QMainWindow):
         self._update_cards_display()
 
     def _on_ticker_update(self, pair: str, state: object):
-        if pair in self._cards:
-            self._cards[pair].update_state(state)
+        self._pending_ticks[pair] = state
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(33, self._flush_ticker_updates)
+
+    def _flush_ticker_updates(self):
+        """Apply the latest coalesced state per pair, redrawing only visible cards."""
+        self._flush_scheduled = False
+        pending, self._pending_ticks = self._pending_ticks, {}
+
+        pairs = self._settings_manager.settings.crypto_pairs
+        visible = set(self._pagination_manager.get_visible_slice(pairs))
+
+        for pair, state in pending.items():
+            card = self._cards.get(pair)
+            if card is not None and pair in visible:
+                card.update_state(state)
+            else:
+                self._stale_pairs.add(pair)
 
     def _on_connection_status(self, connected: bool, message: str):
         logger.debug(f"Connection status: {connected}, {message}")
 
     def _on_connection_state_changed(self, state: str, message: str, retry_count: int):
-        for card in self._cards.values():
-            card.set_connection_state(state)
+        self._current_conn_state = state
+        for pair in self._visible_now:
+            card = self._cards.get(pair)
+            if card is not None:
+                card.set_connection_state(state)
 
-        # hack fix
-        if self._last_connection_state  == 'reconnecting' and state == 'connecting':
-            self._market_controller.set_proxy()
+        if state == "connected" and self._last_connection_state != "connected":
+            self._replay_cached_states()
+
+        handler = _TRANSITIONS.get((self._last_connection_state, state))
         self._last_connection_state = state
+        if handler:
+            handler(self)
+
+    def _replay_cached_states(self):
+        """Show the last known price again after a reconnect, before new ticks arrive."""
+        now = time.monotonic()
+        visible = set(self._visible_now)
+        for pair, card in self._cards.items():
+            if pair not in visible:
+                self._stale_pairs.add(pair)
+                continue
+            state = self._market_controller.get_price_state(pair)
+            if state:
+                card.update_state(state)
+                if now - state.updated_at > _STALE_AFTER_SECONDS:
+                    card.mark_stale(state.updated_at)
 
     def _on_proxy_changed(self):
         self._market_controller.set_proxy()
@@ -231,13 +340,13 @@ class MainWindow(QMainWindow):
             card.refresh_style()
 
     def _on_display_limit_changed(self, limit: int):
+        self._cache_cap = self._card_cache_cap(limit)
+        # Reloading re-renders the page, which schedules the height adjustment
         self._load_pairs()
-        self._view_manager.adjust_window_height(limit)
 
     def _on_minimalist_view_changed(self, enabled: bool):
         self._settings_manager.update_minimalist_view(enabled)
         self._view_manager.reset_state()
-        self._view_manager.adjust_window_height()
         self._update_cards_display()
 
     def _on_auto_scroll_changed(self, enabled: bool, interval: int):
@@ -247,7 +356,7 @@ class MainWindow(QMainWindow):
         self._market_controller.set_data_source()
 
     def _on_data_source_changed_complete(self):
-        pass
+        self._url_template = self._build_url_template()
 
     def _toggle_edit_mode(self):
         if self._edit_mode:
@@ -267,32 +376,32 @@ class MainWindow(QMainWindow):
     def _remove_pair(self, pair: str):
         if self._settings_manager.remove_pair(pair):
             if pair in self._cards:
-                self._cards[pair].deleteLater()
-                del self._cards[pair]
+                card = self._cards.pop(pair)
+                self.cards_layout.removeWidget(card)
+                card.deleteLater()
             self._market_controller.clear_pair_data(pair)
             self._load_pairs()
 
-    def _open_pair_in_browser(self, pair: str):
-        if pair.lower().startswith("chain:"):
-            parts = pair.split(":")
-            if len(parts) >= 3:
-                network = parts[1]
-                address = parts[2]
-                url = f"https://dexscreener.com/{network}/{address}"
-                webbrowser.open(url)
-            return
-
+    def _build_url_template(self) -> Callable[[str], str]:
+        """Build the exchange trade page URL formatter for the current source and language."""
         source = self._settings_manager.settings.data_source
         lang = self._settings_manager.settings.language
         if source.lower() == "binance":
-            formatted_pair = pair.replace("-", "_").upper()
             locale_prefix = "zh-CN" if lang == "zh_CN" else "en"
-            url = f"https://www.binance.com/{locale_prefix}/trade/{formatted_pair}"
-        else:
-            formatted_pair = pair.lower()
-            url_prefix = "zh-hans/" if lang == "zh_CN" else ""
-            url = f"https://www.okx.com/{url_prefix}trade-spot/{formatted_pair}"
-        webbrowser.open(url)
+            return lambda pair: (
+                f"https://www.binance.com/{locale_prefix}/trade/{pair.replace('-', '_').upper()}"
+            )
+        url_prefix = "zh-hans/" if lang == "zh_CN" else ""
+        return lambda pair: f"https://www.okx.com/{url_prefix}trade-spot/{pair.lower()}"
+
+    def _open_pair_in_browser(self, pair: str):
+        if pair.startswith("chain:"):
+            url = get_dexscreener_url(pair)
+            if url:
+                webbrowser.open(url)
+            return
+
+        webbrowser.open(self._url_template(pair))
 
     def _on_add_alert_requested(self, pair: str):
         current_price = self._market_controller.get_current_price(pair)
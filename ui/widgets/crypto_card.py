@@ -1,13 +1,15 @@
 import logging
 import os
+import time
 
-from PyQt6.QtCore import Qt, QTimer, QUrl, pyqtSignal
+from PyQt6.QtCore import QEvent, QObject, Qt, QTimer, QUrl, pyqtSignal
 from PyQt6.QtGui import QColor, QContextMenuEvent, QDesktopServices, QMouseEvent
 from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 from PyQt6.QtSvgWidgets import QSvgWidget
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
+    QToolTip,
     QVBoxLayout,
     QWidget,
 )
@@ -33,6 +35,10 @@ class CryptoCard(CardWidget):
         self.pair = pair
         self._edit_mode = False
         self._current_percentage = "0.00%"
+        # time.monotonic() of the replayed cached price; None while prices are live
+        self._stale_since: float | None = None
+        # Last stylesheet applied to the card itself; Qt reparses on every setStyleSheet
+        self._card_css = ""
         self._loaded_icon_url = None
         self._icon_source_index = 0
         self._icon_sources_to_try = []
@@ -175,6 +181,7 @@ class CryptoCard(CardWidget):
         self.price_label = QLabel(_("Loading..."))
         self.price_label.setStyleSheet("font-size: 16px; font-weight: 600;")
         self.price_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.price_label.installEventFilter(self)
         layout.addWidget(self.price_label)
 
     def _get_cache_path(self, ext: str = ".svg") -> str:
@@ -390,6 +397,27 @@ class CryptoCard(CardWidget):
         display_text = f"{price} {trend}" if trend else price
         self.price_label.setText(display_text)
         self.price_label.setStyleSheet(f"font-size: 16px; font-weight: 600; color: {color};")
+        self._stale_since = None
+
+    def mark_stale(self, updated_at: float):
+        """Dim a price replayed from cache until the next live tick replaces it."""
+        self._stale_since = updated_at
+        self.price_label.setStyleSheet("font-size: 16px; font-weight: 600; color: #888888;")
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        # Stale age is computed when the tooltip is shown, so it keeps advancing.
+        # The event type is checked first: CardWidget filters events before _setup_ui().
+        if (
+            event.type() == QEvent.Type.ToolTip
+            and obj is self.price_label
+            and self._stale_since is not None
+        ):
+            age = int(time.monotonic() - self._stale_since)
+            QToolTip.showText(
+                event.globalPos(), _("Last update {seconds}s ago").format(seconds=age), obj
+            )
+            return True
+        return super().eventFilter(obj, event)
 
     def set_connection_state(self, state: str):
         if state == "connected":
@@ -421,7 +449,7 @@ class CryptoCard(CardWidget):
         settings = get_settings_manager().settings
 
         if not settings.dynamic_background:
-            self.setStyleSheet("")
+            self._apply_card_css("")
             return
 
         try:
@@ -430,7 +458,7 @@ class CryptoCard(CardWidget):
             pct_val = 0.0
 
         if pct_val == 0:
-            self.setStyleSheet("")
+            self._apply_card_css("")
             return
 
         is_up = pct_val > 0
@@ -444,11 +472,16 @@ class CryptoCard(CardWidget):
 
         bg_color = f"rgba({r}, {g}, {b}, {opacity:.2f})"
 
-        self.setStyleSheet(
+        self._apply_card_css(
             f"CryptoCard {{ background-color: {bg_color}; "
             f"border: 1px solid rgba(0,0,0,0.05); border-radius: 10px; }}"
         )
 
+    def _apply_card_css(self, css: str):
+        if css != self._card_css:
+            self._card_css = css
+            self.setStyleSheet(css)
+
     def update_percentage(self, percentage: str):
         self._current_percentage = percentage
         self.percentage_label.setText(percentage)
@@ -470,11 +503,10 @@ class CryptoCard(CardWidget):
     def mouseDoubleClickEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton:
             if self.pair.startswith("chain:"):
-                parts = self.pair.split(":")
-                if len(parts) >= 3:
-                    net = parts[1]
-                    addr = parts[2]
-                    url = f"https://dexscreener.com/{net}/{addr}"
+                from core.utils import get_dexscreener_url
+
+                url = get_dexscreener_url(self.pair)
+                if url:
                     QDesktopServices.openUrl(QUrl(url))
             else:
                 self.double_clicked.emit(self.pair)